@@ -61,6 +61,8 @@ class LinuxContainer(Container):
         gpu_ids: Optional[List[int]] = None,
     ) -> List[str]:
         extra_args = [
+            # reap processes orphaned by tests (e.g. ray workers)
+            "--init",
             "--env",
             "NVIDIA_DISABLE_REQUIRE=1",
             "--add-host",
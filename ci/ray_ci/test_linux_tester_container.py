@@ -1,6 +1,7 @@
 import json
 import os
 import platform
+import subprocess
 import sys
 import pytest
 import tempfile
@@ -72,7 +73,8 @@ def test_enough_gpus() -> None:
 def test_run_tests_in_docker() -> None:
     inputs = []
 
-    def _mock_popen(input: List[str]) -> None:
+    def _mock_popen(input: List[str], stdin=None) -> None:
+        assert stdin == subprocess.DEVNULL
         inputs.append(" ".join(input))
 
     with mock.patch("subprocess.Popen", side_effect=_mock_popen), mock.patch(
@@ -85,6 +87,7 @@ def test_run_tests_in_docker() -> None:
         input_str = inputs[-1]
         assert "--env ENV_01 --env ENV_02 --env BUILDKITE" in input_str
         assert "--network host" in input_str
+        assert "--init" in input_str
         assert '--gpus "device=0,1"' in input_str
         assert "--volume /tmp:/tmp/bazel_event_logs" in input_str
         assert (
@@ -24,12 +24,12 @@ def test_chunk_into_n() -> None:
 def test_docker_login(mock_client) -> None:
     def _mock_subprocess_run(
         cmd: List[str],
-        stdin=None,
+        input=None,
         stdout=None,
         stderr=None,
         check=True,
     ) -> None:
-        assert stdin.read() == b"password"
+        assert input == b"password"
 
     mock_client.return_value.get_authorization_token.return_value = {
         "authorizationData": [
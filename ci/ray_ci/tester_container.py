@@ -187,7 +187,8 @@ class TesterContainer(Container):
             # using GCC instead.
             commands.append("unset CC CXX")
         # note that we run tests serially within each docker, since we already use
-        # multiple dockers to shard tests
+        # multiple dockers to shard tests; bazel_export_options is evaluated per
+        # container so each run gets its own event log file in the shared mount
         test_cmd = "bazel test --jobs=1 --config=ci $(./ci/run/bazel_export_options) "
         if self.build_type == "debug":
             test_cmd += "--config=ci-debug "
@@ -213,5 +214,7 @@ class TesterContainer(Container):
                 network=self.network,
                 gpu_ids=gpu_ids,
                 volumes=[f"{bazel_log_dir_host}:{self.bazel_log_dir}"],
-            )
+            ),
+            # shards run concurrently, so none of them should read from our stdin
+            stdin=subprocess.DEVNULL,
         )
@@ -4,7 +4,6 @@ import logging
 import os
 import subprocess
 import sys
-import tempfile
 
 import boto3
 from typing import List
@@ -57,25 +56,20 @@ def docker_login(docker_ecr: str) -> None:
         .decode("utf-8")
         .split(":")
     )
-    with tempfile.TemporaryFile() as f:
-        f.write(bytes(password, "utf-8"))
-        f.flush()
-        f.seek(0)
-
-        subprocess.run(
-            [
-                "docker",
-                "login",
-                "--username",
-                user,
-                "--password-stdin",
-                docker_ecr,
-            ],
-            stdin=f,
-            stdout=sys.stdout,
-            stderr=sys.stderr,
-            check=True,
-        )
+    subprocess.run(
+        [
+            "docker",
+            "login",
+            "--username",
+            user,
+            "--password-stdin",
+            docker_ecr,
+        ],
+        input=password.encode("utf-8"),
+        stdout=sys.stdout,
+        stderr=sys.stderr,
+        check=True,
+    )
 
 
 def docker_pull(image: str) -> None:
@@ -124,9 +124,7 @@ class TensorflowCheckpoint(FrameworkCheckpoint):
                 "Please supply a directory to `TensorflowCheckpoint.from_saved_model`"
             )
         tempdir = tempfile.mkdtemp()
-        # TODO(ml-team): Replace this with copytree()
-        os.rmdir(tempdir)
-        shutil.copytree(dir_path, tempdir)
+        shutil.copytree(dir_path, tempdir, dirs_exist_ok=True)
 
         checkpoint = cls.from_directory(tempdir)
         if preprocessor: